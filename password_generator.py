@@ -1,13 +1,30 @@
 import string
 import secrets
 import random
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 from enum import Enum, auto
 import json
 import sys
 import argparse
+import concurrent.futures
+import functools
+import itertools
+import mmap
+import os
+from array import array
 from dataclasses import dataclass
 
+try:
+    import orjson  # Optional: faster JSON serialization for large results
+except ImportError:
+    orjson = None
+
+# Shared cryptographically secure random source
+_SYSRAND = secrets.SystemRandom()
+
+# Re-validate generated passwords against the policy (set PWGEN_STRICT=1)
+_STRICT = os.environ.get('PWGEN_STRICT', '') not in ('', '0')
+
 class PasswordStrength(Enum):
     """Enumeration of password strength levels"""
     BASIC = auto()
@@ -20,6 +37,32 @@ class PasswordCategory(Enum):
     COMPLEX = auto()
     PASSPHRASE = auto()
 
+# Menu numbers and CLI names mapped to enum values
+_CATEGORY_BY_NUM = {
+    '1': PasswordCategory.ALPHANUMERIC,
+    '2': PasswordCategory.COMPLEX,
+    '3': PasswordCategory.PASSPHRASE
+}
+_STRENGTH_BY_NUM = {
+    '1': PasswordStrength.BASIC,
+    '2': PasswordStrength.STRONG,
+    '3': PasswordStrength.PARANOID
+}
+_CATEGORY_BY_NAME = {
+    'alphanumeric': PasswordCategory.ALPHANUMERIC,
+    'complex': PasswordCategory.COMPLEX,
+    'passphrase': PasswordCategory.PASSPHRASE
+}
+_STRENGTH_BY_NAME = {
+    'basic': PasswordStrength.BASIC,
+    'strong': PasswordStrength.STRONG,
+    'paranoid': PasswordStrength.PARANOID
+}
+
+# Enum values mapped to the names written in saved results
+_CAT_NAME = {e: e.name for e in PasswordCategory}
+_STRENGTH_NAME = {e: e.name for e in PasswordStrength}
+
 @dataclass
 class PasswordPolicy:
     """Configuration for password generation policies"""
@@ -50,6 +93,9 @@ class InputValidationError(PasswordGeneratorError):
 class CharacterLake:
     """Secure character repository for password generation"""
     
+    # Character class identifiers used by the class lookup table
+    _DIGIT, _SPECIAL, _UPPER, _LOWER = b'\x01', b'\x02', b'\x03', b'\x04'
+    
     def __init__(self, policy: Optional[PasswordPolicy] = None):
         """
         Initialize character sets with optional policy constraints
@@ -72,22 +118,54 @@ class CharacterLake:
             self._exclude_similar_chars()
         if self.policy.exclude_chars:
             self._exclude_specified_chars()
+        
+        self._build_class_table()
+        self._build_category_sets()
+    
+    def _build_category_sets(self) -> None:
+        """Precompute the character set for every password category"""
+        self._set_by_category: Dict[PasswordCategory, str] = {
+            PasswordCategory.ALPHANUMERIC: self.lowercase + self.uppercase + self.digits,
+            PasswordCategory.COMPLEX: self.lowercase + self.uppercase + self.digits + self.special,
+            PasswordCategory.PASSPHRASE: self.lowercase + self.uppercase,
+        }
+        # ASCII byte form of each set, used for bulk random sampling
+        self._bytes_by_category: Dict[PasswordCategory, bytes] = {
+            category: chars.encode('ascii') for category, chars in self._set_by_category.items()
+        }
+    
+    def _build_class_table(self) -> None:
+        """Build a byte lookup table mapping each character to its class"""
+        table = bytearray(256)
+        for class_id, chars in ((self._DIGIT, self.digits), (self._SPECIAL, self.special),
+                                (self._UPPER, self.uppercase), (self._LOWER, self.lowercase)):
+            for c in chars:
+                table[ord(c)] = class_id[0]
+        self._class_table = bytes(table)
     
     def _exclude_similar_chars(self) -> None:
         """Remove visually similar characters"""
-        similar_chars = "l1IoO0"
-        for char in similar_chars:
-            self.lowercase = self.lowercase.replace(char.lower(), '')
-            self.uppercase = self.uppercase.replace(char.upper(), '')
-            self.digits = self.digits.replace(char, '')
+        self._delete_chars("l1IoO0")
     
     def _exclude_specified_chars(self) -> None:
         """Remove user-specified characters"""
-        for char in self.policy.exclude_chars:
-            self.lowercase = self.lowercase.replace(char.lower(), '')
-            self.uppercase = self.uppercase.replace(char.upper(), '')
-            self.digits = self.digits.replace(char, '')
-            self.special = self.special.replace(char, '')
+        self._delete_chars(self.policy.exclude_chars)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _deletion_bytes(chars: str) -> bytes:
+        """ASCII bytes of chars and their single-character case variants"""
+        variants = ''.join(v for c in chars for v in (c, c.lower(), c.upper()) if len(v) == 1)
+        # The sets are pure ASCII, so non-ASCII variants can never match
+        return variants.encode('ascii', 'ignore')
+    
+    def _delete_chars(self, chars: str) -> None:
+        """Remove characters (and their single-character case variants) from every character set"""
+        delete = self._deletion_bytes(chars)
+        self.lowercase = self.lowercase.encode().translate(None, delete).decode()
+        self.uppercase = self.uppercase.encode().translate(None, delete).decode()
+        self.digits = self.digits.encode().translate(None, delete).decode()
+        self.special = self.special.encode().translate(None, delete).decode()
     
     def get_character_set(self, category: PasswordCategory) -> str:
         """
@@ -99,19 +177,33 @@ class CharacterLake:
         Returns:
             String of available characters
         """
-        if category == PasswordCategory.ALPHANUMERIC:
-            return self.lowercase + self.uppercase + self.digits
-        elif category == PasswordCategory.COMPLEX:
-            return self.lowercase + self.uppercase + self.digits + self.special
-        elif category == PasswordCategory.PASSPHRASE:
-            return self.lowercase + self.uppercase
-        else:
+        try:
+            return self._set_by_category[category]
+        except KeyError:
+            raise ValueError("Invalid password category")
+    
+    def get_character_bytes(self, category: PasswordCategory) -> bytes:
+        """
+        Get the character set for a category as ASCII bytes
+        
+        Args:
+            category: PasswordCategory enum value
+            
+        Returns:
+            Bytes of available characters
+        """
+        try:
+            return self._bytes_by_category[category]
+        except KeyError:
             raise ValueError("Invalid password category")
     
     def validate_policy_compliance(self, password: str, category: PasswordCategory) -> bool:
         """
         Validate password against current policy
         
+        Generated passwords comply by construction, so this is intended for
+        checking externally supplied passwords (and for PWGEN_STRICT mode).
+        
         Args:
             password: Password to validate
             category: Password category
@@ -119,15 +211,15 @@ class CharacterLake:
         Returns:
             bool: True if password complies with policy
         """
-        if len(password) < self.policy.min_length:
-            return False
-        if len(password) > self.policy.max_length:
+        if not self.policy.min_length <= len(password) <= self.policy.max_length:
             return False
         
-        digit_count = sum(1 for c in password if c in self.digits)
-        special_count = sum(1 for c in password if c in self.special)
-        upper_count = sum(1 for c in password if c in self.uppercase)
-        lower_count = sum(1 for c in password if c in self.lowercase)
+        # Characters outside latin-1 belong to no class, so they can be dropped
+        classes = password.encode('latin-1', 'ignore').translate(self._class_table)
+        digit_count = classes.count(self._DIGIT)
+        special_count = classes.count(self._SPECIAL)
+        upper_count = classes.count(self._UPPER)
+        lower_count = classes.count(self._LOWER)
         
         if category == PasswordCategory.ALPHANUMERIC:
             return (digit_count >= self.policy.min_digits and
@@ -146,10 +238,50 @@ class CharacterLake:
         
         return False
 
+class MappedWordlist(Sequence):
+    """Read-only wordlist backed by a memory-mapped file and a line offset index"""
+    
+    def __init__(self, path: str):
+        """
+        Memory-map a wordlist file and index its non-blank lines
+        
+        Args:
+            path: Path to a newline-separated wordlist file
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self._mm = b''
+            else:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # Interleaved (start, end) byte offsets of every non-blank line,
+        # found with one C-level splitlines pass instead of per-line scanning
+        self._bounds = array('I')
+        lines = self._mm[:].splitlines(keepends=True)
+        start = 0
+        for end, line in zip(itertools.accumulate(map(len, lines)), lines):
+            if not line.isspace():
+                self._bounds.extend((start, end))
+            start = end
+    
+    def __len__(self) -> int:
+        return len(self._bounds) // 2
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("wordlist index out of range")
+        start, end = self._bounds[2 * index], self._bounds[2 * index + 1]
+        return self._mm[start:end].decode('utf-8').strip()
+
 class PasswordGenerator:
     """Industrial-grade password generator with policy enforcement"""
     
     WORDLIST_FILE = "eff_large_wordlist.txt"  # For passphrase generation
+    PARALLEL_MIN_SHARD = 2048  # Minimum passwords per worker process in generate_multiple
     
     def __init__(self, policy: Optional[PasswordPolicy] = None):
         """
@@ -160,14 +292,31 @@ class PasswordGenerator:
         """
         self.policy = policy or PasswordPolicy()
         self.character_lake = CharacterLake(self.policy)
-        self.wordlist = None # Load only when needed
+        self._wordlist = None # Load only when needed
+        
+        # Specialized generators, built on first use and keyed on the policy
+        # minimums they capture so later policy changes are honoured
+        self._fast_generators: Dict[tuple, Callable[[int, int], List[str]]] = {}
+    
+    @property
+    def wordlist(self) -> Sequence[str]:
+        """Passphrase wordlist, loaded on first access"""
+        if self._wordlist is None:
+            self._wordlist = self._load_wordlist()
+        return self._wordlist
+    
+    @wordlist.setter
+    def wordlist(self, words: Optional[Sequence[str]]) -> None:
+        """Use a custom wordlist; None restores the default on next access"""
+        self._wordlist = words
     
-    def _load_wordlist(self) -> List[str]:
-        """Load wordlist for passphrase generation"""
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_wordlist(cls) -> Sequence[str]:
+        """Load wordlist for passphrase generation (cached and shared by all instances)"""
         try:
-            with open(PasswordGenerator.WORDLIST_FILE, 'r', encoding='utf-8') as f:
-                return [line.strip() for line in f if line.strip()]
-        except IOError as e:
+            return MappedWordlist(cls.WORDLIST_FILE)
+        except (IOError, ValueError) as e:
             raise PasswordGeneratorError(f"Failed to load wordlist for passphrase generation: {str(e)}")
     
     def generate_password(self, length: int, category: PasswordCategory, 
@@ -187,33 +336,149 @@ class PasswordGenerator:
             PolicyViolationError: If requirements cannot be met
             InputValidationError: For invalid parameters
         """
+        self._validate_length(length)
+        
+        if category == PasswordCategory.PASSPHRASE:
+            return self._generate_passphrase(length, strength)
+        
+        return self._get_fast_generator(category, strength)(1, length)[0]
+    
+    def _get_fast_generator(self, category: PasswordCategory,
+                            strength: PasswordStrength) -> Callable[[int, int], List[str]]:
+        """Look up (or build) the specialized generator for a category and strength"""
+        policy = self.policy
+        key = (category, strength, policy.min_digits, policy.min_upper, policy.min_lower, policy.min_special)
+        try:
+            return self._fast_generators[key]
+        except KeyError:
+            pass
+        if (category not in (PasswordCategory.ALPHANUMERIC, PasswordCategory.COMPLEX)
+                or not isinstance(strength, PasswordStrength)):
+            raise ValueError("Invalid password category or strength")
+        generate = self._fast_generators[key] = self._make_batch_generator(category, strength)
+        return generate
+    
+    def _validate_length(self, length: int) -> None:
+        """Raise InputValidationError if length is outside the policy bounds"""
         if not self.policy.min_length <= length <= self.policy.max_length:
             raise InputValidationError(
                 f"Password length must be between {self.policy.min_length} and {self.policy.max_length}"
             )
+    
+    def _make_batch_generator(self, category: PasswordCategory,
+                              strength: PasswordStrength) -> Callable[[int, int], List[str]]:
+        """
+        Build a generator specialized for one category and strength
         
-        if category == PasswordCategory.PASSPHRASE:
-            return self._generate_passphrase(length, strength)
+        The returned function captures the character sets, per-class
+        minimums and randomness source so none are looked up per call.
+        Each character class is sampled once for a whole batch and the
+        result is sliced per password, so randomness is drawn in bulk.
         
-        characters = self.character_lake.get_character_set(category)
+        Args:
+            category: Password category (alphanumeric or complex)
+            strength: Password strength level
+            
+        Returns:
+            Function taking (count, length) and returning a list of passwords
+        """
+        lake = self.character_lake
+        required = [
+            (lake.digits, self.policy.min_digits),
+            (lake.uppercase, self.policy.min_upper),
+            (lake.lowercase, self.policy.min_lower),
+        ]
+        if category == PasswordCategory.COMPLEX:
+            required.append((lake.special, self.policy.min_special))
         
+        required_total = sum(n for _, n in required)
         if strength == PasswordStrength.BASIC:
-            generator = random.choice
+            make_sampler, shuffle = self._make_basic_sampler, random.shuffle
         else:
-            generator = secrets.choice
+            make_sampler, shuffle = self._make_sampler, _SYSRAND.shuffle
+        class_samplers = [(make_sampler(chars.encode('ascii')), n) for chars, n in required if n > 0]
+        fill_sampler = make_sampler(lake.get_character_bytes(category))
+        
+        def generate(count: int, length: int) -> List[str]:
+            if required_total > length:
+                raise PolicyViolationError(
+                    f"Password length {length} is too short to hold the {required_total} required characters"
+                )
+            
+            # Satisfy the per-class minimums directly, fill the rest from the full set
+            fill = length - required_total
+            pools = [(sample(count * n), n) for sample, n in class_samplers]
+            pools.append((fill_sampler(count * fill), fill))
+            
+            passwords = []
+            for i in range(count):
+                password = list(''.join(pool[i * n:(i + 1) * n] for pool, n in pools))
+                shuffle(password)
+                passwords.append(''.join(password))
+            
+            # Compliance is guaranteed by construction; only re-check in strict mode
+            if _STRICT and not all(lake.validate_policy_compliance(p, category) for p in passwords):
+                raise PolicyViolationError("Generated password does not meet policy requirements")
+            return passwords
+        
+        return generate
+    
+    @staticmethod
+    def _make_basic_sampler(charset: bytes) -> Callable[[int], str]:
+        """
+        Build a function drawing random strings with the non-cryptographic source
+        
+        Args:
+            charset: ASCII character set to sample from
+            
+        Returns:
+            Function taking a length and returning a random string of that length
+        """
+        characters = charset.decode('ascii')
+        
+        def sample(length: int) -> str:
+            if length <= 0:
+                return ''
+            if not characters:
+                raise PolicyViolationError("Character set is empty")
+            return ''.join(random.choices(characters, k=length))
+        
+        return sample
+    
+    @staticmethod
+    def _make_sampler(charset: bytes) -> Callable[[int], str]:
+        """
+        Build a function drawing cryptographically secure random strings
         
-        attempts = 0
-        max_attempts = 100
+        Random bytes are drawn in bulk from secrets.token_bytes; bytes at or
+        above the largest multiple of the set size are rejected so that
+        every character is equally likely.
         
-        while attempts < max_attempts:
-            password = ''.join(generator(characters) for _ in range(length))
-            if self.character_lake.validate_policy_compliance(password, category):
-                return password
-            attempts += 1
+        Args:
+            charset: ASCII character set to sample from
+            
+        Returns:
+            Function taking a length and returning a random string of that length
+        """
+        k = len(charset)
+        # An empty set only fails when characters are actually requested from it
+        cutoff = (256 // k) * k if 0 < k <= 256 else 0
         
-        raise PolicyViolationError(
-            f"Could not generate password that meets policy requirements after {max_attempts} attempts"
-        )
+        def sample(length: int) -> str:
+            if length <= 0:
+                return ''
+            if not 0 < k <= 256:
+                raise PolicyViolationError("Character set is empty or too large for byte sampling")
+            out = bytearray()
+            while len(out) < length:
+                for b in secrets.token_bytes((length - len(out)) * 2):
+                    if b < cutoff:
+                        out.append(charset[b % k])
+                        if len(out) == length:
+                            break
+            return out.decode('ascii')
+        
+        return sample
     
     def _generate_passphrase(self, word_count: int, strength: PasswordStrength) -> str:
         """
@@ -226,45 +491,40 @@ class PasswordGenerator:
         Returns:
             Generated passphrase string
         """
-        if self.wordlist is None:
-            self.wordlist = self._load_wordlist()
-            
         if not self.wordlist:
             raise PasswordGeneratorError("Passphrase generation requires a wordlist")
         
         if strength == PasswordStrength.BASIC:
-            generator = random.choice
+            words = random.choices(self.wordlist, k=word_count)
         else:
-            generator = secrets.choice
-        
-        words = [generator(self.wordlist) for _ in range(word_count)]
+            words = [_SYSRAND.choice(self.wordlist) for _ in range(word_count)]
         
         # Apply some transformations for stronger passphrases
         if strength == PasswordStrength.STRONG:
-            # Capitalize random words
-            for i in range(len(words)):
-                if secrets.randbelow(2):
-                    words[i] = words[i].capitalize()
+            # Capitalize random words, one coin flip per bit of a single draw
+            mask = _SYSRAND.getrandbits(len(words))
+            words = [w.capitalize() if (mask >> i) & 1 else w for i, w in enumerate(words)]
             
             # Add a digit
-            words.append(secrets.choice(self.character_lake.digits))
+            words.append(_SYSRAND.choice(self.character_lake.digits))
         
         elif strength == PasswordStrength.PARANOID:
             # Capitalize all words
             words = [w.capitalize() for w in words]
             
             # Add digits and special characters
-            words.append(secrets.choice(self.character_lake.digits))
-            words.append(secrets.choice(self.character_lake.special))
+            words.append(_SYSRAND.choice(self.character_lake.digits))
+            words.append(_SYSRAND.choice(self.character_lake.special))
             
             # Shuffle the components
-            secrets.SystemRandom().shuffle(words)
+            _SYSRAND.shuffle(words)
         
-        separator = secrets.choice(['-', '_', '.', ' ', '']) if strength != PasswordStrength.BASIC else ' '
+        separator = _SYSRAND.choice(['-', '_', '.', ' ', '']) if strength != PasswordStrength.BASIC else ' '
         return separator.join(words)
     
     def generate_multiple(self, count: int, length: int, category: PasswordCategory,
-                         strength: PasswordStrength = PasswordStrength.STRONG) -> List[str]:
+                         strength: PasswordStrength = PasswordStrength.STRONG,
+                         executor: Optional[concurrent.futures.Executor] = None) -> List[str]:
         """
         Generate multiple passwords with the same specifications
         
@@ -273,15 +533,87 @@ class PasswordGenerator:
             length: Desired password length
             category: Password category
             strength: Password strength level
+            executor: Optional process pool to shard large batches across;
+                generation is serial without one
             
         Returns:
             List of generated passwords
         """
-        return [self.generate_password(length, category, strength) for _ in range(count)]
+        if category == PasswordCategory.PASSPHRASE or count <= 0:
+            return [self.generate_password(length, category, strength) for _ in range(count)]
+        
+        self._validate_length(length)
+        generate = self._get_fast_generator(category, strength)
+        
+        # Shard large batches across the caller's pool; small ones are cheaper serially
+        workers = min(available_cpus(), count // self.PARALLEL_MIN_SHARD) if executor else 0
+        if workers < 2:
+            return generate(count, length)
+        
+        shard_size, extra = divmod(count, workers)
+        shards = [(self.policy, shard_size + (i < extra), length, category, strength) for i in range(workers)]
+        return [password for shard in executor.map(_generate_shard, shards) for password in shard]
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on (respects affinity where supported)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _generate_shard(shard: Tuple[PasswordPolicy, int, int, PasswordCategory, PasswordStrength]) -> List[str]:
+    """Generate one shard of a parallel generate_multiple call in a worker process"""
+    policy, count, length, category, strength = shard
+    return PasswordGenerator(policy)._get_fast_generator(category, strength)(count, length)
 
 class PasswordCLI:
     """Command-line interface for password generator"""
     
+    STREAM_THRESHOLD = 100  # Counts above this are streamed / written compactly
+    STREAM_BATCH_SIZE = 1000  # Minimum passwords generated per batch when streaming
+    
+    @staticmethod
+    def _process_pool(count: int) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """Create a worker pool if count is large enough to shard, else None"""
+        cpus = available_cpus()
+        if cpus < 2 or count < 2 * PasswordGenerator.PARALLEL_MIN_SHARD:
+            return None
+        return concurrent.futures.ProcessPoolExecutor(max_workers=cpus)
+    
+    @staticmethod
+    def _write_json(path: str, result: dict, pretty: bool) -> None:
+        """Write a result dict to a JSON file, using orjson when it is installed"""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 if pretty else 0))
+        else:
+            with open(path, 'w') as f:
+                json.dump(result, f, indent=2 if pretty else None)
+    
+    @staticmethod
+    def _stream_passwords(generator: PasswordGenerator, count: int, length: int,
+                          category: PasswordCategory, strength: PasswordStrength,
+                          executor: Optional[concurrent.futures.Executor] = None) -> None:
+        """Write passwords to stdout one per line, generating them in bounded batches"""
+        write = sys.stdout.write
+        # Batches must be big enough for generate_multiple to shard across every CPU
+        batch_size = max(PasswordCLI.STREAM_BATCH_SIZE,
+                         PasswordGenerator.PARALLEL_MIN_SHARD * available_cpus())
+        remaining = count
+        try:
+            while remaining > 0:
+                batch = generator.generate_multiple(min(remaining, batch_size), length, category,
+                                                    strength, executor)
+                write('\n'.join(batch))
+                write('\n')
+                remaining -= len(batch)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. piped into head); stop quietly.
+            # Point stdout at devnull so the flush at interpreter exit does not fail again.
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            sys.exit(0)
+    
     @staticmethod
     def run_interactive():
         """Run interactive password generation wizard"""
@@ -297,11 +629,7 @@ class PasswordCLI:
             
             category_choice = input("\nSelect category (1-3): ").strip()
             try:
-                category = {
-                    '1': PasswordCategory.ALPHANUMERIC,
-                    '2': PasswordCategory.COMPLEX,
-                    '3': PasswordCategory.PASSPHRASE
-                }[category_choice]
+                category = _CATEGORY_BY_NUM[category_choice]
             except KeyError:
                 raise InputValidationError("Invalid category selection")
             
@@ -321,11 +649,7 @@ class PasswordCLI:
             
             strength_choice = input("\nSelect strength level (1-3): ").strip()
             try:
-                strength = {
-                    '1': PasswordStrength.BASIC,
-                    '2': PasswordStrength.STRONG,
-                    '3': PasswordStrength.PARANOID
-                }[strength_choice]
+                strength = _STRENGTH_BY_NUM[strength_choice]
             except KeyError:
                 raise InputValidationError("Invalid strength level selection")
             
@@ -342,13 +666,12 @@ class PasswordCLI:
             if save == 'y':
                 filename = input("Enter filename: ").strip()
                 try:
-                    with open(filename, 'w') as f:
-                        json.dump({
-                            'password': password,
-                            'category': category.name,
-                            'strength': strength.name,
-                            'length': length
-                        }, f, indent=2)
+                    PasswordCLI._write_json(filename, {
+                        'password': password,
+                        'category': _CAT_NAME[category],
+                        'strength': _STRENGTH_NAME[strength],
+                        'length': length
+                    }, pretty=True)
                     print(f"Password saved to {filename}")
                 except IOError as e:
                     print(f"Failed to save file: {str(e)}", file=sys.stderr)
@@ -368,8 +691,8 @@ class PasswordCLI:
         """Run password generator from command-line arguments"""
         parser = argparse.ArgumentParser(description='Industrial Password Generator')
         parser.add_argument('--length', type=int, required=True, help='Password length or word count')
-        parser.add_argument('--category', choices=['alphanumeric', 'complex', 'passphrase'], required=True)
-        parser.add_argument('--strength', choices=['basic', 'strong', 'paranoid'], default='strong')
+        parser.add_argument('--category', choices=list(_CATEGORY_BY_NAME), required=True)
+        parser.add_argument('--strength', choices=list(_STRENGTH_BY_NAME), default='strong')
         parser.add_argument('--count', type=int, default=1, help='Number of passwords to generate')
         parser.add_argument('--output', help='Output file to save results')
         
@@ -377,26 +700,29 @@ class PasswordCLI:
         
         try:
             # Convert arguments to enums
-            category = {
-                'alphanumeric': PasswordCategory.ALPHANUMERIC,
-                'complex': PasswordCategory.COMPLEX,
-                'passphrase': PasswordCategory.PASSPHRASE
-            }[args.category]
+            category = _CATEGORY_BY_NAME[args.category]
+            strength = _STRENGTH_BY_NAME[args.strength]
             
-            strength = {
-                'basic': PasswordStrength.BASIC,
-                'strong': PasswordStrength.STRONG,
-                'paranoid': PasswordStrength.PARANOID
-            }[args.strength]
-            
-            # Generate passwords
+            # Generate passwords, sharing one worker pool across the run when it is large
             generator = PasswordGenerator()
-            if args.count == 1:
-                password = generator.generate_password(args.length, category, strength)
-                result = {'password': password}
-            else:
-                passwords = generator.generate_multiple(args.count, args.length, category, strength)
-                result = {'passwords': passwords}
+            executor = PasswordCLI._process_pool(args.count)
+            try:
+                if not args.output and args.count > PasswordCLI.STREAM_THRESHOLD:
+                    # Large runs to stdout: stream one password per line instead of building JSON
+                    PasswordCLI._stream_passwords(generator, args.count, args.length, category,
+                                                  strength, executor)
+                    return
+                
+                if args.count == 1:
+                    password = generator.generate_password(args.length, category, strength)
+                    result = {'password': password}
+                else:
+                    passwords = generator.generate_multiple(args.count, args.length, category,
+                                                            strength, executor)
+                    result = {'passwords': passwords}
+            finally:
+                if executor is not None:
+                    executor.shutdown()
             
             # Add metadata
             result.update({
@@ -409,8 +735,9 @@ class PasswordCLI:
             # Output results
             if args.output:
                 try:
-                    with open(args.output, 'w') as f:
-                        json.dump(result, f, indent=2)
+                    # Pretty-printing is only worth its cost for small results
+                    PasswordCLI._write_json(args.output, result,
+                                            pretty=args.count <= PasswordCLI.STREAM_THRESHOLD)
                     print(f"Results saved to {args.output}")
                 except IOError as e:
                     print(f"Failed to save file: {str(e)}", file=sys.stderr)